@@ -12,9 +12,13 @@ from datetime import datetime
 
 from model import N2SEfficiencyModel
 from config import (
-    DEFAULT_PHASE_ALLOCATION, DEFAULT_RISK_WEIGHTS, PHASE_ORDER,
-    COST_AVOIDANCE_OPTIONS, get_phase_colors, format_currency, format_hours,
-    validate_scenario_results
+    APP_VERSION, DEFAULT_PHASE_ALLOCATION, DEFAULT_RISK_WEIGHTS, PHASE_ORDER,
+    INITIATIVE_FALLBACK, INITIATIVE_MATURITY_DEFINITIONS, INDUSTRY_BENCHMARKS,
+    COST_AVOIDANCE_OPTIONS, RISK_LEVEL_DEFINITIONS, AUTOMATION_ASSESSMENT,
+    assess_current_maturity, calculate_target_feasibility,
+    get_initiative_description, get_maturity_description,
+    get_phase_risk_info, get_risk_level_description,
+    get_phase_colors, format_currency, format_hours, validate_scenario_results
 )
 
 # Page configuration
@@ -60,17 +64,9 @@ def initialize_model():
 
 def create_sidebar_controls():
     """Create sidebar input controls for model parameters"""
-    from config import (
-        get_initiative_description, get_maturity_description,
-        RISK_LEVEL_DEFINITIONS, get_phase_risk_info,
-        get_risk_level_description, INITIATIVE_FALLBACK, 
-        INDUSTRY_BENCHMARKS, COST_AVOIDANCE_OPTIONS
-    )
-    
     st.sidebar.title("Model Parameters")
     
     # Version indicator in sidebar
-    from config import APP_VERSION
     st.sidebar.caption(f"{APP_VERSION}")
     
     # Baseline Efficiency Reminder - Updated
@@ -84,8 +80,6 @@ def create_sidebar_controls():
     # Current State Assessment
     st.sidebar.subheader("Current State Assessment")
     
-    from config import AUTOMATION_ASSESSMENT, assess_current_maturity
-    
     # Collect assessment responses
     assessment_responses = {}
     
@@ -137,8 +131,6 @@ def create_sidebar_controls():
     )
     
     # Generate scenario configuration based on target and maturity
-    from config import calculate_target_feasibility
-    
     # We'll need selected initiatives for feasibility check - get a preview first
     available_initiatives = INITIATIVE_FALLBACK  # Will be updated below
     
@@ -537,7 +529,17 @@ def create_cost_breakdown_by_phase_chart(cost_results, summary_df):
     return fig
 
 
-def create_hours_breakdown_by_phase_chart(summary_df, cost_results):
+def calculate_hours_avoided(summary_df, cost_results):
+    """Convert cost avoidance into hours avoided for each summary row"""
+    # Only Post Go-Live carries cost avoidance; development phases avoid no hours
+    is_post_golive = summary_df['Phase'] == 'Post Go-Live'
+    post_golive_hours = summary_df.loc[is_post_golive, 'Baseline Hours'].iloc[0]
+    blended_rate = cost_results['baseline_cost']['Post Go-Live'] / post_golive_hours if post_golive_hours > 0 else 100
+    post_golive_avoided = cost_results['avoidance']['Post Go-Live'] / blended_rate if blended_rate > 0 else 0
+    return (is_post_golive * post_golive_avoided).tolist()
+
+
+def create_hours_breakdown_by_phase_chart(summary_df, hours_avoided):
     """Create detailed hours breakdown chart showing baseline vs modeled hours with savings"""
     fig = make_subplots(
         rows=1, cols=1,
@@ -549,17 +551,8 @@ def create_hours_breakdown_by_phase_chart(summary_df, cost_results):
     modeled_hours = summary_df['Modeled Hours'].tolist()
     hours_saved = summary_df['Hour Variance'].tolist()  # Negative values = savings
     
-    # Calculate hours avoided (equivalent to cost avoidance but in hours)
-    # This represents future operational time savings
-    hours_avoided = []
-    for phase in phases:
-        if phase == 'Post Go-Live':
-            # For Post Go-Live, calculate hours avoided based on cost avoidance
-            cost_avoidance = cost_results['avoidance'][phase]
-            blended_rate = cost_results['baseline_cost'][phase] / baseline_hours[phases.tolist().index(phase)] if baseline_hours[phases.tolist().index(phase)] > 0 else 100
-            hours_avoided.append(cost_avoidance / blended_rate if blended_rate > 0 else 0)
-        else:
-            hours_avoided.append(0)  # No hours avoided in development phases
+    # hours_avoided is cost avoidance expressed in hours (see
+    # calculate_hours_avoided); it represents future operational time savings
     
     # Baseline hours (what we would work without initiatives)
     fig.add_trace(go.Bar(
@@ -852,17 +845,12 @@ def export_to_excel(summary_df, kpi_summary, cost_results, initiative_impact_df=
         kpi_df.to_excel(writer, sheet_name='KPIs')
         
         # Cost breakdown
-        cost_breakdown = []
-        for phase in PHASE_ORDER:
-            cost_breakdown.append({
-                'Phase': phase,
-                'Baseline Cost': cost_results['baseline_cost'][phase],
-                'Modeled Cost': cost_results['modeled_cost'][phase],
-                'Cost Savings': cost_results['savings'][phase],
-                'Cost Avoidance': cost_results['avoidance'][phase]
-            })
-        
-        cost_df = pd.DataFrame(cost_breakdown)
+        cost_df = pd.DataFrame({
+            'Baseline Cost': cost_results['baseline_cost'],
+            'Modeled Cost': cost_results['modeled_cost'],
+            'Cost Savings': cost_results['savings'],
+            'Cost Avoidance': cost_results['avoidance']
+        }).reindex(PHASE_ORDER).rename_axis('Phase').reset_index()
         cost_df.to_excel(writer, sheet_name='Cost Details', index=False)
     
     return output.getvalue()
@@ -873,7 +861,6 @@ def main():
     load_custom_css()
     
     # Title and version
-    from config import APP_VERSION
     st.title("N2S Impact Modeling Tool")
     st.markdown(f"*{APP_VERSION}*")
     
@@ -1215,8 +1202,11 @@ def main():
         - **Cost Avoidance**: Future operational savings from better quality/processes
         """)
         
+        # Hours avoided feed both the hours chart and its data table below
+        hours_avoided = calculate_hours_avoided(summary_df, cost_results)
+        
         # New comprehensive hours breakdown chart
-        hours_breakdown_chart = create_hours_breakdown_by_phase_chart(summary_df, cost_results)
+        hours_breakdown_chart = create_hours_breakdown_by_phase_chart(summary_df, hours_avoided)
         st.plotly_chart(hours_breakdown_chart, use_container_width=True)
         
         st.markdown("""
@@ -1231,30 +1221,14 @@ def main():
         st.subheader("Hours Chart Data Breakdown")
         st.markdown("**Data used to create the Executive Hours Summary chart above:**")
         
-        # Create the data table for hours chart using available data
-        hours_chart_data = []
-        for phase in summary_df['Phase']:
-            baseline_hours_val = summary_df[summary_df['Phase'] == phase]['Baseline Hours'].iloc[0]
-            modeled_hours_val = summary_df[summary_df['Phase'] == phase]['Modeled Hours'].iloc[0]
-            hours_saved_val = summary_df[summary_df['Phase'] == phase]['Hour Variance'].iloc[0]
-            
-            # Calculate hours avoided for this phase
-            if phase == 'Post Go-Live':
-                cost_avoidance = cost_results['avoidance'][phase]
-                blended_rate = cost_results['baseline_cost'][phase] / baseline_hours_val if baseline_hours_val > 0 else 100
-                hours_avoided_val = cost_avoidance / blended_rate if blended_rate > 0 else 0
-            else:
-                hours_avoided_val = 0
-            
-            hours_chart_data.append({
-                'Phase': phase,
-                'Baseline Hours': baseline_hours_val,
-                'Actual Hours (After Initiatives)': modeled_hours_val,
-                'Hours Saved': hours_saved_val,
-                'Hours Avoided': hours_avoided_val
-            })
-        
-        hours_chart_df = pd.DataFrame(hours_chart_data)
+        # Create the data table for hours chart straight from the summary columns
+        hours_chart_df = pd.DataFrame({
+            'Phase': summary_df['Phase'],
+            'Baseline Hours': summary_df['Baseline Hours'],
+            'Actual Hours (After Initiatives)': summary_df['Modeled Hours'],
+            'Hours Saved': summary_df['Hour Variance'],
+            'Hours Avoided': hours_avoided
+        })
         
         # Display the table with formatting
         st.dataframe(
@@ -1345,11 +1319,6 @@ def main():
         
         # Initiative Maturity Guide
         with st.expander("Initiative Maturity Level Guide"):
-            from config import (
-                INITIATIVE_FALLBACK, INITIATIVE_MATURITY_DEFINITIONS,
-                get_initiative_description, get_maturity_description
-            )
-            
             st.markdown("### Initiative Definitions and Maturity Levels")
             
             for initiative in INITIATIVE_FALLBACK:
@@ -1374,11 +1343,6 @@ def main():
         
         # Risk Assessment Guide
         with st.expander("Risk Assessment Guide"):
-            from config import (
-                PHASE_ORDER, RISK_LEVEL_DEFINITIONS,
-                get_phase_risk_info, get_risk_level_description
-            )
-            
             st.markdown("### Risk Level Guidelines")
             
             # General risk information
@@ -3,6 +3,7 @@ Configuration file for N2S Efficiency Modeling Application
 Contains defaults, constants, and helper functions
 """
 
+from functools import lru_cache
 from typing import Dict, Tuple
 
 # =============================================================================
@@ -699,7 +700,14 @@ def get_phase_colors() -> Dict[str, str]:
 
 def calculate_baseline_hours(total_hours: float, allocation: Dict[str, float]) -> Dict[str, float]:
     """Calculate baseline hours for each phase"""
-    return {phase: total_hours * (pct / 100.0) for phase, pct in allocation.items()}
+    # Dicts aren't hashable, so memoize on the allocation's items and hand
+    # each caller its own dict to keep the cached result immutable
+    return dict(_cached_baseline_hours(total_hours, tuple(allocation.items())))
+
+@lru_cache(maxsize=32)
+def _cached_baseline_hours(total_hours: float, allocation_items: tuple) -> tuple:
+    """Memoized phase-hour split keyed on (total_hours, allocation items)"""
+    return tuple((phase, total_hours * (pct / 100.0)) for phase, pct in allocation_items)
 
 def format_currency(amount: float) -> str:
     """Format currency with appropriate thousands separators"""
@@ -3,28 +3,153 @@ Core calculation engine for N2S Efficiency Modeling Application
 Handles data loading, scenario application, and cost calculations
 """
 
+import numpy as np
 import pandas as pd
-from typing import Dict, Tuple, Optional, List
+from typing import Dict, Tuple, Optional, List, NamedTuple
 
 from config import (
-    PHASE_ORDER, DEFAULT_PHASE_ALLOCATION, DEFAULT_RISK_WEIGHTS,
+    PHASE_ORDER, DEFAULT_PHASE_ALLOCATION, DEFAULT_RISK_WEIGHTS, DEFAULT_TOTAL_HOURS,
     INDUSTRY_BENCHMARKS, calculate_baseline_hours, INITIATIVE_FALLBACK
 )
 
+# Column position of each phase in PHASE_ORDER-aligned arrays
+PHASE_IDX = {phase: i for i, phase in enumerate(PHASE_ORDER)}
+
+# Development phases (everything before Post Go-Live) and their PHASE_ORDER mask
+DEV_PHASES = frozenset({'Discover', 'Plan', 'Design', 'Build', 'Test', 'Deploy'})
+DEV_MASK = np.array([phase in DEV_PHASES for phase in PHASE_ORDER])
+
+# More conservative caps for organizations not ready for aggressive targets
+CONSERVATIVE_CAPS = {
+    'Discover': 0.35, 'Plan': 0.40, 'Design': 0.45,
+    'Build': 0.50, 'Test': 0.60, 'Deploy': 0.45, 'Post Go-Live': 0.65
+}
+
 
 def get_initiatives() -> List[str]:
     """Return list of initiative names."""
     return INITIATIVE_FALLBACK.copy()
 
 
+class CostAvoidanceParams(NamedTuple):
+    """Cost avoidance settings resolved from a COST_AVOIDANCE_OPTIONS entry"""
+    enabled: bool
+    multiplier: float
+    ongoing_factor: float
+
+
+def _cost_avoidance_params(
+    include_cost_avoidance: bool, cost_avoidance_config: Optional[Dict]
+) -> CostAvoidanceParams:
+    """Resolve cost avoidance flags and config lookups once per calculation"""
+    if not (include_cost_avoidance and cost_avoidance_config):
+        return CostAvoidanceParams(False, 0.0, 0.0)
+    return CostAvoidanceParams(
+        True,
+        cost_avoidance_config.get('multiplier', 1.0),
+        cost_avoidance_config.get('ongoing_factor', 1.0)
+    )
+
+
+def _phase_vector(values: Dict[str, float]) -> np.ndarray:
+    """Return per-phase values as a float array in PHASE_ORDER"""
+    return np.fromiter(
+        (values[phase] for phase in PHASE_ORDER), dtype=np.float64, count=len(PHASE_ORDER)
+    )
+
+
+def _maturity_vector(
+    maturity_levels: Dict[str, float], initiatives: pd.Index, missing: float = 0.0
+) -> np.ndarray:
+    """Return maturity % per initiative as a float array aligned to initiatives"""
+    return np.fromiter(
+        (maturity_levels.get(i, missing) for i in initiatives),
+        dtype=np.float64, count=len(initiatives)
+    )
+
+
+def _phase_dict(vector: np.ndarray) -> Dict[str, float]:
+    """Return a PHASE_ORDER-aligned array as a phase-keyed dict of floats"""
+    return dict(zip(PHASE_ORDER, vector.tolist()))
+
+
+def _cap_scale_factors(total_savings: np.ndarray, max_savings: np.ndarray) -> np.ndarray:
+    """Return per-phase factors that scale total savings down to their caps"""
+    over_cap = total_savings > max_savings
+    return np.divide(
+        max_savings, total_savings, out=np.ones_like(total_savings), where=over_cap
+    )
+
+
+# Maximum hours saved per phase under CONSERVATIVE_CAPS, against the default
+# project baseline; fixed inputs, so evaluated once at import
+_CONSERVATIVE_MAX_SAVINGS = _phase_vector(
+    calculate_baseline_hours(DEFAULT_TOTAL_HOURS, DEFAULT_PHASE_ALLOCATION)
+) * _phase_vector(CONSERVATIVE_CAPS)
+
+
+def _scenario_phase_multipliers(
+    target_percentage: float, current_level: int, industry_benchmarks: Dict
+) -> np.ndarray:
+    """Return per-phase boost multipliers for a target savings scenario"""
+    # Calculate scaling factors based on target and current maturity
+    base_intensity = target_percentage / 15.0  # 15% = 1.0x baseline
+    
+    # Maturity-based adjustment
+    maturity_factor = current_level / 3.0  # Level 3 = 1.0x, higher levels get bonus
+    
+    # Progressive scaling
+    if target_percentage <= 10:
+        additional_factor = 0.0
+        testing_boost = base_intensity * 0.2 * maturity_factor
+        quality_boost = base_intensity * 0.15 * maturity_factor
+        
+    elif target_percentage <= 20:
+        progress = (target_percentage - 10) / 10.0
+        additional_factor = progress * 0.8 * maturity_factor
+        testing_boost = base_intensity * (0.3 + progress * 0.2) * maturity_factor
+        quality_boost = base_intensity * (0.2 + progress * 0.15) * maturity_factor
+        
+    else:
+        progress = min(1.0, (target_percentage - 20) / 10.0)
+        additional_factor = (0.8 + progress * 0.7) * maturity_factor
+        testing_boost = base_intensity * (0.5 + progress * 0.3) * maturity_factor
+        quality_boost = base_intensity * (0.35 + progress * 0.25) * maturity_factor
+    
+    phase_multipliers = np.ones(len(PHASE_ORDER))
+    
+    # Apply enhancements if factors are significant
+    if additional_factor > 0 or testing_boost > 0:
+        # Enhanced test automation 
+        if testing_boost > 0:
+            base_test_boost = industry_benchmarks['testing_phase_reduction']
+            phase_multipliers[PHASE_IDX['Test']] *= (1 + base_test_boost * testing_boost)
+        
+        # Quality improvements across development phases
+        if quality_boost > 0:
+            base_quality_boost = industry_benchmarks['quality_improvement']
+            quality_phases = ['Design', 'Build', 'Test']
+            if additional_factor > 0.5:
+                quality_phases.append('Deploy')
+                
+            for phase in quality_phases:
+                phase_multipliers[PHASE_IDX[phase]] *= (1 + base_quality_boost * quality_boost)
+    
+    return phase_multipliers
+
+
 class N2SEfficiencyModel:
     """Core model for calculating N2S efficiency improvements"""
     
+    __slots__ = ('matrix_data', 'initiatives', 'loaded', '_matrix_np')
+    
     def __init__(self):
         """Initialize the model"""
         self.matrix_data = None
         self.initiatives = []
         self.loaded = False
+        # Column-major int16 copy of matrix_data for the hot path
+        self._matrix_np = None
         
     def create_sample_data(self):
         """Create and use sample matrix data"""
@@ -53,7 +178,16 @@ class N2SEfficiencyModel:
             'Post Go-Live': [-96, -64, -77, -115, -51, -58, -90]
         }
         
-        self.matrix_data = pd.DataFrame(sample_data, index=INITIATIVE_FALLBACK)
+        # Column-major (initiative x phase) so per-phase reductions and
+        # column scaling walk contiguous memory. Matrix deltas are whole
+        # hours well within int16 range; they are promoted to float64 by the
+        # maturity multiply in apply_maturity_and_scenario
+        self._matrix_np = np.asfortranarray(
+            np.array([sample_data[p] for p in PHASE_ORDER], dtype=np.int16).T
+        )
+        self.matrix_data = pd.DataFrame(
+            self._matrix_np, index=INITIATIVE_FALLBACK, columns=PHASE_ORDER, dtype=np.float64
+        )
         self.initiatives = INITIATIVE_FALLBACK.copy()
         self.loaded = True
 
@@ -81,81 +215,33 @@ class N2SEfficiencyModel:
         if industry_benchmarks is None:
             industry_benchmarks = INDUSTRY_BENCHMARKS
             
-        # Apply maturity levels (convert percentages to decimal multipliers)
-        effective_matrix = self.matrix_data.copy().astype(float)
-        for initiative in effective_matrix.index:
-            if initiative in maturity_levels:
-                maturity_multiplier = maturity_levels[initiative] / 100.0
-                effective_matrix.loc[initiative] = (
-                    effective_matrix.loc[initiative] * maturity_multiplier
-                )
-        
-        # Apply scaling based on target savings and organizational maturity
         target_percentage = scenario_config.get('target_percentage', 15)
         current_maturity = scenario_config.get('current_maturity', {})
         current_level = current_maturity.get('maturity_level', 2)
         
-        # Calculate scaling factors based on target and current maturity
-        base_intensity = target_percentage / 15.0  # 15% = 1.0x baseline
-        
-        # Maturity-based adjustment
-        maturity_factor = current_level / 3.0  # Level 3 = 1.0x, higher levels get bonus
+        # Apply maturity levels (convert percentages to decimal multipliers);
+        # initiatives without a maturity level keep their full deltas
+        initiatives = self.matrix_data.index
+        maturity_multipliers = _maturity_vector(
+            maturity_levels, initiatives, missing=100.0
+        ) / 100.0
         
-        # Progressive scaling
-        if target_percentage <= 10:
-            additional_factor = 0.0
-            testing_boost = base_intensity * 0.2 * maturity_factor
-            quality_boost = base_intensity * 0.15 * maturity_factor
-            
-        elif target_percentage <= 20:
-            progress = (target_percentage - 10) / 10.0
-            additional_factor = progress * 0.8 * maturity_factor
-            testing_boost = base_intensity * (0.3 + progress * 0.2) * maturity_factor
-            quality_boost = base_intensity * (0.2 + progress * 0.15) * maturity_factor
-            
-        else:
-            progress = min(1.0, (target_percentage - 20) / 10.0)
-            additional_factor = (0.8 + progress * 0.7) * maturity_factor
-            testing_boost = base_intensity * (0.5 + progress * 0.3) * maturity_factor
-            quality_boost = base_intensity * (0.35 + progress * 0.25) * maturity_factor
+        # With every initiative at 0% maturity there are no deltas to scale
+        if not maturity_multipliers.any():
+            return pd.DataFrame(0.0, index=initiatives, columns=PHASE_ORDER)
         
-        # Apply enhancements if factors are significant
-        if additional_factor > 0 or testing_boost > 0:
-            # Enhanced test automation 
-            if testing_boost > 0:
-                base_test_boost = industry_benchmarks['testing_phase_reduction']
-                effective_matrix['Test'] *= (1 + base_test_boost * testing_boost)
-            
-            # Quality improvements across development phases
-            if quality_boost > 0:
-                base_quality_boost = industry_benchmarks['quality_improvement']
-                quality_phases = ['Design', 'Build', 'Test']
-                if additional_factor > 0.5:
-                    quality_phases.append('Deploy')
-                    
-                for phase in quality_phases:
-                    if phase in effective_matrix.columns:
-                        effective_matrix[phase] *= (1 + base_quality_boost * quality_boost)
+        # Scale rows by maturity and phase columns by the scenario's boosts
+        phase_multipliers = _scenario_phase_multipliers(
+            target_percentage, current_level, industry_benchmarks
+        )
+        effective = self._matrix_np * maturity_multipliers[:, None] * phase_multipliers
         
         # Apply conservative caps for high targets with low maturity
         if target_percentage > 20 and current_level < 4:
-            # More conservative caps for organizations not ready for aggressive targets
-            conservative_caps = {
-                'Discover': 0.35, 'Plan': 0.40, 'Design': 0.45,
-                'Build': 0.50, 'Test': 0.60, 'Deploy': 0.45, 'Post Go-Live': 0.65
-            }
-            
-            baseline_hours = calculate_baseline_hours(17054, DEFAULT_PHASE_ALLOCATION)
-            
-            for phase in effective_matrix.columns:
-                if phase in conservative_caps:
-                    max_savings = baseline_hours[phase] * conservative_caps[phase]
-                    total_savings = abs(effective_matrix[phase].sum())
-                    if total_savings > max_savings:
-                        scale_factor = max_savings / total_savings
-                        effective_matrix[phase] *= scale_factor
+            total_savings = np.abs(effective.sum(axis=0))
+            effective *= _cap_scale_factors(total_savings, _CONSERVATIVE_MAX_SAVINGS)
         
-        return effective_matrix
+        return pd.DataFrame(effective, index=initiatives, columns=PHASE_ORDER)
 
     def calculate_phase_hours(
         self, 
@@ -166,14 +252,13 @@ class N2SEfficiencyModel:
         """Calculate baseline and modeled hours for each phase"""
         baseline_hours = calculate_baseline_hours(total_hours, phase_allocation)
         
-        # Calculate modeled hours by applying deltas
-        modeled_hours = {}
-        for phase in PHASE_ORDER:
-            if phase in effective_deltas.columns:
-                total_delta = effective_deltas[phase].sum()
-                modeled_hours[phase] = max(0, baseline_hours[phase] + total_delta)
-            else:
-                modeled_hours[phase] = baseline_hours[phase]
+        # Calculate modeled hours by applying each phase's summed deltas
+        phase_deltas = effective_deltas.reindex(
+            columns=PHASE_ORDER, fill_value=0.0
+        ).to_numpy().sum(axis=0)
+        modeled_hours = _phase_dict(
+            np.maximum(0, _phase_vector(baseline_hours) + phase_deltas)
+        )
                 
         return baseline_hours, modeled_hours
 
@@ -187,37 +272,24 @@ class N2SEfficiencyModel:
     ) -> Dict[str, Dict[str, float]]:
         """Calculate comprehensive cost analysis"""
         
-        baseline_cost = {}
-        modeled_cost = {}
-        savings = {}
-        avoidance = {}
+        baseline_cost = _phase_vector(baseline_hours) * blended_rate
+        modeled_cost = _phase_vector(modeled_hours) * blended_rate
+        savings = baseline_cost - modeled_cost
+        avoidance = np.zeros(len(PHASE_ORDER))
         
-        for phase in PHASE_ORDER:
-            baseline_cost[phase] = baseline_hours[phase] * blended_rate
-            modeled_cost[phase] = modeled_hours[phase] * blended_rate
-            savings[phase] = baseline_cost[phase] - modeled_cost[phase]
-            
-            # Cost avoidance calculation
-            if include_cost_avoidance and cost_avoidance_config:
-                if phase == 'Post Go-Live':
-                    # Cost avoidance applies primarily to ongoing operations
-                    multiplier = cost_avoidance_config.get('multiplier', 1.0)
-                    ongoing_factor = cost_avoidance_config.get('ongoing_factor', 1.0)
-                    
-                    # Calculate total development savings as basis for avoidance
-                    dev_savings = sum(savings[p] for p in PHASE_ORDER if p != 'Post Go-Live')
-                    base_avoidance = max(0, dev_savings * ongoing_factor)
-                    avoidance[phase] = base_avoidance * multiplier
-                else:
-                    avoidance[phase] = 0.0
-            else:
-                avoidance[phase] = 0.0
+        # Cost avoidance applies primarily to ongoing operations
+        params = _cost_avoidance_params(include_cost_avoidance, cost_avoidance_config)
+        if params.enabled:
+            # Calculate total development savings as basis for avoidance
+            dev_savings = savings[DEV_MASK].sum()
+            base_avoidance = max(0, dev_savings * params.ongoing_factor)
+            avoidance[~DEV_MASK] = base_avoidance * params.multiplier
         
         return {
-            'baseline_cost': baseline_cost,
-            'modeled_cost': modeled_cost,
-            'savings': savings,
-            'avoidance': avoidance
+            'baseline_cost': _phase_dict(baseline_cost),
+            'modeled_cost': _phase_dict(modeled_cost),
+            'savings': _phase_dict(savings),
+            'avoidance': _phase_dict(avoidance)
         }
 
     def calculate_risk_adjusted_hours(
@@ -226,13 +298,12 @@ class N2SEfficiencyModel:
         risk_weights: Dict[str, float]
     ) -> Dict[str, float]:
         """Apply risk weights to modeled hours"""
-        risk_adjusted = {}
-        for phase in PHASE_ORDER:
-            if phase in risk_weights:
-                risk_adjusted[phase] = modeled_hours[phase] * risk_weights[phase]
-            else:
-                risk_adjusted[phase] = modeled_hours[phase]
-        return risk_adjusted
+        # Phases without a risk weight are left unadjusted
+        weights = np.fromiter(
+            (risk_weights.get(phase, 1.0) for phase in PHASE_ORDER),
+            dtype=np.float64, count=len(PHASE_ORDER)
+        )
+        return _phase_dict(_phase_vector(modeled_hours) * weights)
 
     def generate_summary_table(
         self,
@@ -244,28 +315,33 @@ class N2SEfficiencyModel:
     ) -> pd.DataFrame:
         """Generate comprehensive summary table"""
         
-        summary_data = []
-        for phase in PHASE_ORDER:
-            hour_variance = modeled_hours[phase] - baseline_hours[phase]
-            hour_variance_pct = (hour_variance / baseline_hours[phase] * 100) if baseline_hours[phase] > 0 else 0
-            
-            cost_variance = modeled_cost[phase] - baseline_cost[phase]
-            cost_variance_pct = (cost_variance / baseline_cost[phase] * 100) if baseline_cost[phase] > 0 else 0
-            
-            summary_data.append({
-                'Phase': phase,
-                'Baseline Hours': baseline_hours[phase],
-                'Modeled Hours': modeled_hours[phase],
-                'Hour Variance': hour_variance,
-                'Hour Variance %': hour_variance_pct,
-                'Baseline Cost': baseline_cost[phase],
-                'Modeled Cost': modeled_cost[phase],
-                'Cost Variance': cost_variance,
-                'Cost Variance %': cost_variance_pct,
-                'Risk-Adjusted Hours': risk_adjusted_hours[phase]
-            })
+        b_hours = _phase_vector(baseline_hours)
+        m_hours = _phase_vector(modeled_hours)
+        b_cost = _phase_vector(baseline_cost)
+        m_cost = _phase_vector(modeled_cost)
+        
+        hour_variance = m_hours - b_hours
+        hour_variance_pct = np.divide(
+            hour_variance, b_hours, out=np.zeros_like(b_hours), where=b_hours > 0
+        ) * 100
         
-        return pd.DataFrame(summary_data)
+        cost_variance = m_cost - b_cost
+        cost_variance_pct = np.divide(
+            cost_variance, b_cost, out=np.zeros_like(b_cost), where=b_cost > 0
+        ) * 100
+        
+        return pd.DataFrame({
+            'Phase': PHASE_ORDER,
+            'Baseline Hours': b_hours,
+            'Modeled Hours': m_hours,
+            'Hour Variance': hour_variance,
+            'Hour Variance %': hour_variance_pct,
+            'Baseline Cost': b_cost,
+            'Modeled Cost': m_cost,
+            'Cost Variance': cost_variance,
+            'Cost Variance %': cost_variance_pct,
+            'Risk-Adjusted Hours': _phase_vector(risk_adjusted_hours)
+        })
 
     def get_kpi_summary(
         self,
@@ -275,15 +351,24 @@ class N2SEfficiencyModel:
     ) -> Dict[str, float]:
         """Calculate key performance indicators"""
         
-        total_baseline_hours = sum(baseline_hours.values())
-        total_modeled_hours = sum(modeled_hours.values())
+        # Stack every per-phase series and reduce them in a single pass
+        totals = np.array([
+            _phase_vector(baseline_hours),
+            _phase_vector(modeled_hours),
+            _phase_vector(cost_results['baseline_cost']),
+            _phase_vector(cost_results['modeled_cost']),
+            _phase_vector(cost_results['savings']),
+            _phase_vector(cost_results['avoidance'])
+        ]).sum(axis=1)
+        (
+            total_baseline_hours, total_modeled_hours,
+            total_baseline_cost, total_modeled_cost,
+            total_cost_savings, total_cost_avoidance
+        ) = totals.tolist()
+        
         total_hours_saved = total_baseline_hours - total_modeled_hours
         total_hours_saved_pct = (total_hours_saved / total_baseline_hours * 100) if total_baseline_hours > 0 else 0
         
-        total_baseline_cost = sum(cost_results['baseline_cost'].values())
-        total_modeled_cost = sum(cost_results['modeled_cost'].values())
-        total_cost_savings = sum(cost_results['savings'].values())
-        total_cost_avoidance = sum(cost_results['avoidance'].values())
         total_financial_benefit = total_cost_savings + total_cost_avoidance
         
         return {
@@ -308,43 +393,48 @@ class N2SEfficiencyModel:
     ) -> pd.DataFrame:
         """Generate detailed initiative impact analysis"""
         
-        impact_data = []
+        maturity = _maturity_vector(maturity_levels, effective_deltas.index)
+        active = maturity > 0
         
-        for initiative in effective_deltas.index:
-            if maturity_levels.get(initiative, 0) > 0:
-                # Calculate hour impacts for development vs post go-live
-                dev_phases = ['Discover', 'Plan', 'Design', 'Build', 'Test', 'Deploy']
-                dev_hours = sum(effective_deltas.loc[initiative, phase] for phase in dev_phases)
-                post_golive_hours = effective_deltas.loc[initiative, 'Post Go-Live']
-                
-                # Calculate financial impacts
-                dev_cost_impact = dev_hours * blended_rate
-                post_golive_cost_impact = post_golive_hours * blended_rate
-                
-                # Add cost avoidance if applicable
-                if include_cost_avoidance and cost_avoidance_config and dev_cost_impact < 0:
-                    multiplier = cost_avoidance_config.get('multiplier', 1.0)
-                    ongoing_factor = cost_avoidance_config.get('ongoing_factor', 1.0)
-                    avoidance_value = abs(dev_cost_impact) * ongoing_factor * multiplier
-                    post_golive_cost_impact -= avoidance_value
-                
-                total_financial_impact = dev_cost_impact + post_golive_cost_impact
-                
-                impact_data.append({
-                    'Initiative': initiative,
-                    'Maturity %': maturity_levels[initiative],
-                    'Baseline Hour Delta': self.matrix_data.loc[initiative].sum(),
-                    'Effective Hour Delta': effective_deltas.loc[initiative].sum(),
-                    'Development Hours': dev_hours,
-                    'Post Go-Live Hours': post_golive_hours,
-                    'Development Cost Impact': dev_cost_impact,
-                    'Post Go-Live Cost Impact': post_golive_cost_impact,
-                    'Total Financial Impact': total_financial_impact
-                })
+        effective_np = effective_deltas[PHASE_ORDER].to_numpy()[active]
+        baseline_np = self.matrix_data.loc[effective_deltas.index].to_numpy()[active]
         
-        df = pd.DataFrame(impact_data)
-        return df.sort_values('Total Financial Impact', ascending=True)
-
+        # Calculate hour impacts for development vs post go-live
+        dev_hours = effective_np[:, DEV_MASK].sum(axis=1)
+        post_golive_hours = effective_np[:, ~DEV_MASK].sum(axis=1)
+        
+        # Calculate financial impacts
+        dev_cost_impact = dev_hours * blended_rate
+        post_golive_cost_impact = post_golive_hours * blended_rate
+        
+        # Add cost avoidance if applicable
+        params = _cost_avoidance_params(include_cost_avoidance, cost_avoidance_config)
+        if params.enabled:
+            avoidance_value = np.where(
+                dev_cost_impact < 0,
+                -dev_cost_impact * params.ongoing_factor * params.multiplier,
+                0.0
+            )
+            post_golive_cost_impact = post_golive_cost_impact - avoidance_value
+        
+        columns = {
+            'Initiative': effective_deltas.index[active],
+            'Maturity %': maturity[active],
+            'Baseline Hour Delta': baseline_np.sum(axis=1),
+            'Effective Hour Delta': effective_np.sum(axis=1),
+            'Development Hours': dev_hours,
+            'Post Go-Live Hours': post_golive_hours,
+            'Development Cost Impact': dev_cost_impact,
+            'Post Go-Live Cost Impact': post_golive_cost_impact,
+            'Total Financial Impact': dev_cost_impact + post_golive_cost_impact
+        }
+        
+        # Order rows by financial impact before building the frame instead of
+        # sorting a copy afterwards; the index keeps each row's unsorted position
+        order = np.argsort(columns['Total Financial Impact'], kind='stable')
+        return pd.DataFrame(
+            {name: values[order] for name, values in columns.items()}, index=order
+        )
 
 def run_model_scenario(
     total_hours: float = 17054,